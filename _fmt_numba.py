@@ -0,0 +1,67 @@
+"""Optional Numba-accelerated escape helper for very large transcripts.
+
+Does the work of html.escape plus the newline-to-<br> replace in a single
+pass over a byte buffer. convert_chat imports this lazily and only routes
+large strings here; when numba/numpy are not installed the import fails and
+the pure-Python path is used instead.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _escape_br(src):
+    # First pass: count the extra bytes the replacements need so the output
+    # buffer can be sized exactly, then fill it in a second pass.
+    n = src.size
+    extra = 0
+    for i in range(n):
+        c = src[i]
+        if c == 38:  # &  -> &amp;
+            extra += 4
+        elif c == 60 or c == 62:  # < -> &lt;   > -> &gt;
+            extra += 3
+        elif c == 10:  # \n -> <br>
+            extra += 3
+    if extra == 0:
+        return src
+    out = np.empty(n + extra, dtype=np.uint8)
+    j = 0
+    for i in range(n):
+        c = src[i]
+        if c == 38:
+            out[j] = 38
+            out[j + 1] = 97
+            out[j + 2] = 109
+            out[j + 3] = 112
+            out[j + 4] = 59
+            j += 5
+        elif c == 60:
+            out[j] = 38
+            out[j + 1] = 108
+            out[j + 2] = 116
+            out[j + 3] = 59
+            j += 4
+        elif c == 62:
+            out[j] = 38
+            out[j + 1] = 103
+            out[j + 2] = 116
+            out[j + 3] = 59
+            j += 4
+        elif c == 10:
+            out[j] = 60
+            out[j + 1] = 98
+            out[j + 2] = 114
+            out[j + 3] = 62
+            j += 4
+        else:
+            out[j] = c
+            j += 1
+    return out
+
+
+def fmt_fast(s):
+    """HTML-escape text and convert newlines to <br> in one compiled pass."""
+    buf = np.frombuffer(s.encode('utf-8'), dtype=np.uint8)
+    return bytes(_escape_br(buf)).decode('utf-8')
@@ -1,232 +1,174 @@
+import argparse
+import glob
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from html import escape
 import os
 import re
+import sys
 
-def convert_conversation_to_html(input_file, output_file=None):
+# orjson parses UTF-8 bytes in C several times faster than the stdlib on the
+# multi-MB exports LM Studio produces; fall back to the stdlib so the script
+# keeps working without any extra installs.
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    try:
+        import ujson
+        _loads = ujson.loads
+    except ImportError:
+        def _intern_keys(obj):
+            # Exports repeat the same keys ('role', 'type', 'text', ...)
+            # thousands of times; interning collapses them to one object
+            # each so later .get lookups compare by identity
+            return {sys.intern(k): v for k, v in obj.items()}
+
+        def _loads(data):
+            return json.loads(data, object_hook=_intern_keys)
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+# Optional single-pass escape kernel (needs numba + numpy, see _fmt_numba);
+# only worth the bytes round-trip for large text blobs
+try:
+    from _fmt_numba import fmt_fast as _fmt_fast
+except ImportError:
+    _fmt_fast = None
+
+_FMT_FAST_MIN = 4096
+_FMT_CACHE_MAX = 1024
+
+# Same character set html.escape(quote=False) covers, plus the newline
+# conversion, so one C-level translate pass replaces escape + replace
+_HTML_TR = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '\n': '<br>'})
+
+
+@lru_cache(maxsize=4096)
+def _fmt_cached(s):
+    return s.translate(_HTML_TR)
+
+
+def _fmt(s):
+    """HTML-escape plain text and convert newlines to <br> tags.
+
+    Short strings recur constantly in exports (stock replies, labels), so
+    they go through a memoized path; caching big blobs would just pin
+    transcript-sized strings in memory.
     """
-    Convert a conversation JSON file to an interactive HTML chat interface.
-    
-    Args:
-        input_file (str): Path to the input JSON file
-        output_file (str): Optional path to save the HTML output
+    if len(s) < _FMT_CACHE_MAX:
+        return _fmt_cached(s)
+    if _fmt_fast is not None and len(s) >= _FMT_FAST_MIN:
+        return _fmt_fast(s)
+    return s.translate(_HTML_TR)
+
+
+@lru_cache(maxsize=None)
+def _fmt_ts(ms):
+    """Format a millisecond timestamp, or 'Unknown' when missing.
+
+    Exports cluster many messages into the same millisecond, so the cache
+    skips most of the datetime work on long conversations.
     """
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Prepare output filename if not provided
-    if not output_file:
-        base_name = os.path.splitext(input_file)[0]
-        output_file = f"{base_name}_chat.html"
-    
-    # Build content
-    content_html = ""
-    
-    # Add system prompt if exists
-    if data.get('systemPrompt'):
-        content_html += f"""
+    if not ms:
+        return 'Unknown'
+    # Integer division keeps the whole path FP-free; isoformat truncates to
+    # seconds anyway, and avoids strftime's per-call format-string parsing
+    return datetime.fromtimestamp(ms // 1000).isoformat(sep=' ', timespec='seconds')
+
+
+# Shared empty defaults so dict.get misses don't allocate a fresh container
+_EMPTY_DICT = {}
+_EMPTY_TUPLE = ()
+
+# The handful of roles that actually occur, pre-capitalized; anything
+# unexpected falls back to str.capitalize
+_ROLE_CAP = {
+    'user': 'User',
+    'assistant': 'Assistant',
+    'system': 'System',
+    'tool': 'Tool',
+    'unknown': 'Unknown',
+}
+
+# (stats key, display label, unit suffix) for the per-step generation stats;
+# a new stat is a one-line addition here instead of another if-branch
+_STAT_SPECS = (
+    ('stopReason', 'Stop Reason', ''),
+    ('tokensPerSecond', 'Tokens Per Second', ''),
+    ('timeToFirstTokenSec', 'Time to First Token', 's'),
+    ('totalTimeSec', 'Total Time', 's'),
+    ('promptTokensCount', 'Prompt Tokens', ''),
+    ('predictedTokensCount', 'Predicted Tokens', ''),
+    ('totalTokensCount', 'Total Tokens', ''),
+)
+
+# Cache-quantization fields shown from the load configuration, in display order
+_QUANT_SPECS = (
+    ('llm.load.llama.vCacheQuantizationType', 'V Cache Quant'),
+    ('llm.load.llama.kCacheQuantizationType', 'K Cache Quant'),
+)
+
+# Precompiled body fragments: the constant HTML is parsed once at import and
+# the per-message work is a plain .format call instead of rebuilding the
+# literal inside an f-string each iteration
+_SYSTEM_PROMPT_TMPL = """
         <div class="system-prompt">
             <div class="system-prompt-title">System Prompt</div>
-            <div>{data['systemPrompt'].replace('\\n', '<br>')}</div>
+            <div>{text}</div>
         </div>
         """
-    
-    # Process messages
-    for i, message in enumerate(data.get('messages', [])):
-        if 'versions' in message and len(message['versions']) > 0:
-            version = message['versions'][0]
-            role = version.get('role', 'unknown')
-            
-            # Get timestamp if available
-            timestamp = ""
-            if 'preprocessed' in version and 'timestamp' in version['preprocessed']:
-                ts = datetime.fromtimestamp(version['preprocessed']['timestamp']/1000)
-                timestamp = ts.strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Get content
-            content_parts = version.get('content', [])
-            message_content = ""
-            for part in content_parts:
-                if part.get('type') == 'text':
-                    message_content = part['text']
-            
-            # Add message bubble
-            content_html += f"""
+
+_MSG_OPEN_TMPL = """
             <div class="message {role}">
                 <div class="message-bubble">
                     <div class="message-header">
-                        <span class="message-role">{role.capitalize()}</span>
-                        {f'<span class="message-timestamp">{timestamp}</span>' if timestamp else ''}
+                        <span class="message-role">{role_cap}</span>
+                        {ts_span}
                     </div>
-                    <div>{format_content(message_content)}</div>
+                    <div>{body}</div>
             """
-            
-            # Include reasoning steps and details if present (for assistant messages)
-            if role == 'assistant' and 'steps' in version:
-                # Collect statistics information first
-                stats_html = ""
-                tool_calls_html = ""
-                
-                # Process steps to collect statistics and tool calls
-                for step in version['steps']:
-                    if 'genInfo' in step and step['genInfo']:
-                        gen_info = step['genInfo']
-                        stats = gen_info.get('stats', {})
-                        
-                        if stats:
-                            stats_html += f"""
-                                    <div class="stats-section">
-                                        <div class="stats-title">Model Generation Statistics</div>
-                            """
-                            
-                            stat_items = []
-                            if 'stopReason' in stats:
-                                stat_items.append(f"Stop Reason: {stats['stopReason']}")
-                            if 'tokensPerSecond' in stats:
-                                stat_items.append(f"Tokens Per Second: {stats['tokensPerSecond']}")
-                            if 'timeToFirstTokenSec' in stats:
-                                stat_items.append(f"Time to First Token: {stats['timeToFirstTokenSec']}s")
-                            if 'totalTimeSec' in stats:
-                                stat_items.append(f"Total Time: {stats['totalTimeSec']}s")
-                            if 'promptTokensCount' in stats:
-                                stat_items.append(f"Prompt Tokens: {stats['promptTokensCount']}")
-                            if 'predictedTokensCount' in stats:
-                                stat_items.append(f"Predicted Tokens: {stats['predictedTokensCount']}")
-                            if 'totalTokensCount' in stats:
-                                stat_items.append(f"Total Tokens: {stats['totalTokensCount']}")
-                            
-                            # Enhanced statistics - Add 1, 2, 3, 4, 6 and 7 metadata
-                            # 3. Model identifier and configuration details
-                            model_identifier = gen_info.get('indexedModelIdentifier', 'Unknown')
-                            if model_identifier != 'Unknown':
-                                # Extract just the model name for cleaner display
-                                model_name = model_identifier.split('/')[-1] if '/' in model_identifier else model_identifier
-                                stat_items.append(f"Model: {model_name}")
-                            
-                            # 6. Context length information (from load configuration)
-                            if 'loadModelConfig' in gen_info and gen_info['loadModelConfig']:
-                                load_config = gen_info['loadModelConfig'].get('fields', [])
-                                for field in load_config:
-                                    if field.get('key') == 'llm.load.contextLength':
-                                        context_length = field.get('value')
-                                        stat_items.append(f"Context Length: {context_length}")
-                            
-                            # 7. Quantization details (from load configuration)
-                            quantization_info = []
-                            if 'loadModelConfig' in gen_info and gen_info['loadModelConfig']:
-                                load_config = gen_info['loadModelConfig'].get('fields', [])
-                                for field in load_config:
-                                    if field.get('key') == 'llm.load.llama.vCacheQuantizationType':
-                                        v_quant = field.get('value', {}).get('value', 'Unknown')
-                                        quantization_info.append(f"V Cache Quant: {v_quant}")
-                                    elif field.get('key') == 'llm.load.llama.kCacheQuantizationType':
-                                        k_quant = field.get('value', {}).get('value', 'Unknown')
-                                        quantization_info.append(f"K Cache Quant: {k_quant}")
-                            
-                            if quantization_info:
-                                stat_items.extend(quantization_info)
-                            
-                            # 2. Memory/CPU thread information (from load configuration)  
-                            cpu_threads = None
-                            if 'loadModelConfig' in gen_info and gen_info['loadModelConfig']:
-                                load_config = gen_info['loadModelConfig'].get('fields', [])
-                                for field in load_config:
-                                    if field.get('key') == 'llm.load.llama.cpuThreadPoolSize':
-                                        cpu_threads = field.get('value')
-                                        stat_items.append(f"CPU Threads: {cpu_threads}")
-                            
-                            # 4. Token efficiency metrics (calculate from tokens)
-                            prompt_tokens = stats.get('promptTokensCount', 0)
-                            predicted_tokens = stats.get('predictedTokensCount', 0)
-                            total_tokens = stats.get('totalTokensCount', 0)
-                            
-                            if predicted_tokens > 0 and prompt_tokens > 0:
-                                # Tokens per prompt token ratio
-                                tokens_per_prompt = round(predicted_tokens / prompt_tokens, 2)
-                                stat_items.append(f"Tokens/Prompt Token Ratio: {tokens_per_prompt}")
-                                
-                                # Efficiency (predicted vs total) 
-                                if total_tokens > 0:
-                                    efficiency = round((predicted_tokens / total_tokens) * 100, 2)
-                                    stat_items.append(f"Efficiency: {efficiency}%")
-                            
-                            for item in stat_items:
-                                stats_html += f'<div class="stat-item">{item}</div>'
-                            
-                            stats_html += "</div>"
-                
-                # Process tool calls
-                if 'tool_calls' in version and version['tool_calls']:
-                    tool_calls_html += '<div class="tool-calls">'
-                    tool_calls_html += '<div class="tool-call-item"><strong>Tool Calls:</strong></div>'
-                    for tool_call in version['tool_calls']:
-                        tool_name = tool_call.get('function', {}).get('name', 'Unknown')
-                        args = tool_call.get('function', {}).get('arguments', {})
-                        tool_calls_html += f'<div class="tool-call-item"><span class="tool-name">{tool_name}</span>: {str(args)}</div>'
-                    tool_calls_html += '</div>'
-                
-                # Add thinking process
-                for step in version['steps']:
-                    if step.get('type') == 'contentBlock':
-                        content = step.get('content', [])
-                        for part in content:
-                            if part.get('type') == 'text':
-                                if 'thinking' in str(step.get('style', {})).lower():
-                                    thinking_content = format_content(part['text'])
-                                    content_html += f"""
+
+_TS_SPAN_TMPL = '<span class="message-timestamp">{ts}</span>'
+
+_STAT_ITEM_TMPL = '<div class="stat-item">{item}</div>'
+
+_TOOL_ITEM_TMPL = '<div class="tool-call-item"><span class="tool-name">{name}</span>: {args}</div>'
+
+# Single-substitution fragments are kept as constant open/close pieces and
+# appended around the dynamic text, so nothing is re-concatenated per step
+_THINKING_OPEN = """
                                     <div class="thinking-process">
                                         <strong>Thinking Process:</strong><br>
-                                        {thinking_content}
-                                    </div>
-                                    """
-                
-                # Add thinking duration if available
-                for step in version['steps']:
-                    if 'style' in step and step['style']:
-                        style = step['style']
-                        if 'title' in style and 'Thought for' in style['title'] and 'seconds' in style['title']:
-                            content_html += f"""
+                                        """
+_DURATION_OPEN = """
                                     <div class="thinking-duration">
-                                        {style['title']}
-                                    </div>
-                                    """
-                
-                # Add the actual response content from the model
-                response_content = ""
-                for step in version['steps']:
-                    if step.get('type') == 'contentBlock':
-                        content = step.get('content', [])
-                        for part in content:
-                            if part.get('type') == 'text':
-                                if 'thinking' not in str(step.get('style', {})).lower():
-                                    response_content += f"""
+                                        """
+_RESPONSE_OPEN = """
                                     <div class="response-content">
                                         <strong>Model Response:</strong><br>
-                                        {format_content(part['text'])}
+                                        """
+_BLOCK_CLOSE = """
                                     </div>
                                     """
-                
-                # Add response content first
-                content_html += response_content
-                
-                # Add statistics and tool calls AFTER the response content
-                if stats_html:
-                    content_html += stats_html
-                
-                if tool_calls_html:
-                    content_html += tool_calls_html
-            
-            content_html += "</div></div>"
-    
-    # Create complete HTML document with light/dark mode toggle
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Conversation Chat Interface</title>
-    <style>
-        :root {{
+
+_STATS_OPEN = """
+                                    <div class="stats-section">
+                                        <div class="stats-title">Model Generation Statistics</div>
+                            """
+
+_TOOLS_OPEN = '<div class="tool-calls"><div class="tool-call-item"><strong>Tool Calls:</strong></div>'
+
+# Stylesheet for the document shell, kept readable here and minified once at
+# import so every generated file ships the compact form
+_CSS_RAW = """        :root {
             --bg-color: white;
             --text-color: black;
             --header-bg: #333;
@@ -254,9 +196,9 @@ def convert_conversation_to_html(input_file, output_file=None):
             --code-border: #ccc;
             --blockquote-bg: #f0f0f0;
             --blockquote-border: #9e9e9e;
-        }}
+        }
 
-        .dark-mode {{
+        .dark-mode {
             --bg-color: #1a1a1a;
             --text-color: #f0f0f0;
             --header-bg: #333;
@@ -284,34 +226,34 @@ def convert_conversation_to_html(input_file, output_file=None):
             --code-border: #555;
             --blockquote-bg: #2d2d2d;
             --blockquote-border: #555;
-        }}
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        }}
+        }
         
-        body {{
+        body {
             background-color: var(--bg-color);
             color: var(--text-color);
             min-height: 100vh;
             padding: 0;
             margin: 0;
             line-height: 1.6;
-        }}
+        }
         
-        .container {{
+        .container {
             width: 100vw;
             height: 100vh;
             background: var(--bg-color);
             border: none;
             box-shadow: none;
             overflow: auto;
-        }}
+        }
         
-        .header {{
+        .header {
             background-color: var(--header-bg);
             color: var(--header-text);
             padding: 20px;
@@ -319,41 +261,41 @@ def convert_conversation_to_html(input_file, output_file=None):
             border-bottom: 1px solid var(--message-border);
             width: 100%;
             position: relative;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 1.8rem;
             margin-bottom: 10px;
-        }}
+        }
         
-        .conversation-info {{
+        .conversation-info {
             display: flex;
             justify-content: space-between;
             flex-wrap: wrap;
             gap: 10px;
             font-size: 0.9rem;
-        }}
+        }
         
-        .chat-container {{
+        .chat-container {
             padding: 20px;
             width: 100%;
             height: calc(100vh - 150px);
             overflow-y: auto;
             box-sizing: border-box;
-        }}
+        }
         
-        .message {{
+        .message {
             margin-bottom: 20px;
             display: flex;
             flex-direction: column;
             align-items: flex-start;
-        }}
+        }
         
-        .message.user {{
+        .message.user {
             align-items: flex-end;
-        }}
+        }
         
-        .message-bubble {{
+        .message-bubble {
             max-width: 80%;
             padding: 15px;
             border: 1px solid var(--message-border);
@@ -362,49 +304,49 @@ def convert_conversation_to_html(input_file, output_file=None):
             word-wrap: break-word;
             border-radius: 12px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .user .message-bubble {{
+        .user .message-bubble {
             background-color: var(--message-user-bg);
             color: var(--message-user-text);
             border-bottom-right-radius: 5px;
-        }}
+        }
         
-        .assistant .message-bubble {{
+        .assistant .message-bubble {
             background-color: var(--message-assistant-bg);
             color: var(--message-assistant-text);
             border: 1px solid var(--message-border);
             border-bottom-left-radius: 5px;
-        }}
+        }
         
-        .message-header {{
+        .message-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 8px;
             font-size: 0.85rem;
-        }}
+        }
         
-        .message-role {{
+        .message-role {
             font-weight: bold;
             text-transform: uppercase;
-        }}
+        }
         
-        .message-timestamp {{
+        .message-timestamp {
             font-size: 0.7rem;
             opacity: 0.8;
-        }}
+        }
         
-        .thinking-process {{
+        .thinking-process {
             background-color: var(--thinking-bg);
             border-left: 4px solid var(--thinking-border);
             padding: 15px;
             margin: 10px 0;
             font-size: 0.9rem;
             border-radius: 8px;
-        }}
+        }
         
-        .thinking-duration {{
+        .thinking-duration {
             background-color: var(--toggle-bg);
             color: var(--toggle-text);
             padding: 5px 10px;
@@ -412,57 +354,57 @@ def convert_conversation_to_html(input_file, output_file=None):
             font-size: 0.8rem;
             margin-top: 5px;
             display: inline-block;
-        }}
+        }
         
-        .stats-section {{
+        .stats-section {
             background-color: var(--stats-bg);
             padding: 15px;
             border: 1px solid var(--stats-border);
             margin: 10px 0;
             font-size: 0.9rem;
             border-radius: 8px;
-        }}
+        }
         
-        .stats-title {{
+        .stats-title {
             font-weight: bold;
             margin-bottom: 8px;
             color: inherit;
-        }}
+        }
         
-        .stat-item {{
+        .stat-item {
             margin: 5px 0;
             padding: 3px 0;
-        }}
+        }
         
-        .tool-calls {{
+        .tool-calls {
             background-color: var(--tool-calls-bg);
             padding: 15px;
             border: 1px solid var(--tool-calls-border);
             margin: 10px 0;
             font-size: 0.9rem;
             border-radius: 8px;
-        }}
+        }
         
-        .tool-call-item {{
+        .tool-call-item {
             margin: 8px 0;
             padding: 5px 0;
-        }}
+        }
         
-        .tool-name {{
+        .tool-name {
             font-weight: bold;
             color: inherit;
-        }}
+        }
         
-        .response-content {{
+        .response-content {
             background-color: var(--response-content-bg);
             border-left: 4px solid var(--response-content-border);
             padding: 15px;
             margin: 10px 0;
             font-size: 0.9rem;
             border-radius: 8px;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             padding: 15px;
             background: var(--footer-bg);
@@ -470,23 +412,23 @@ def convert_conversation_to_html(input_file, output_file=None):
             font-size: 0.8rem;
             width: 100%;
             position: relative;
-        }}
+        }
         
-        .system-prompt {{
+        .system-prompt {
             background-color: var(--system-prompt-bg);
             padding: 15px;
             border: 1px solid var(--system-prompt-border);
             margin: 15px 0;
             font-size: 0.9rem;
             border-radius: 8px;
-        }}
+        }
         
-        .system-prompt-title {{
+        .system-prompt-title {
             font-weight: bold;
             margin-bottom: 8px;
-        }}
+        }
         
-        .theme-toggle {{
+        .theme-toggle {
             position: absolute;
             top: 20px;
             right: 20px;
@@ -501,15 +443,15 @@ def convert_conversation_to_html(input_file, output_file=None):
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
         
-        .theme-toggle:hover {{
+        .theme-toggle:hover {
             background-color: var(--message-border);
-        }}
+        }
         
-        .theme-toggle-icon {{
+        .theme-toggle-icon {
             font-size: 1.2rem;
-        }}
+        }
         
         /* Enhanced Markdown styling */
         .markdown-content h1,
@@ -517,39 +459,39 @@ def convert_conversation_to_html(input_file, output_file=None):
         .markdown-content h3,
         .markdown-content h4,
         .markdown-content h5,
-        .markdown-content h6 {{
+        .markdown-content h6 {
             margin-top: 1.5em;
             margin-bottom: 0.8em;
             font-weight: bold;
-        }}
+        }
         
-        .markdown-content h1 {{
+        .markdown-content h1 {
             font-size: 1.8rem;
-        }}
+        }
         
-        .markdown-content h2 {{
+        .markdown-content h2 {
             font-size: 1.5rem;
-        }}
+        }
         
-        .markdown-content h3 {{
+        .markdown-content h3 {
             font-size: 1.2rem;
-        }}
+        }
         
-        .markdown-content p {{
+        .markdown-content p {
             margin-bottom: 0.8em;
-        }}
+        }
         
         .markdown-content ul,
-        .markdown-content ol {{
+        .markdown-content ol {
             margin: 0.8em 0;
             padding-left: 1.5em;
-        }}
+        }
         
-        .markdown-content li {{
+        .markdown-content li {
             margin-bottom: 0.4em;
-        }}
+        }
         
-        .markdown-content pre {{
+        .markdown-content pre {
             background-color: var(--code-bg);
             border: 1px solid var(--code-border);
             border-radius: 6px;
@@ -557,42 +499,69 @@ def convert_conversation_to_html(input_file, output_file=None):
             overflow-x: auto;
             margin: 1em 0;
             font-size: 0.9rem;
-        }}
+        }
         
-        .markdown-content code {{
+        .markdown-content code {
             background-color: var(--code-bg);
             border: 1px solid var(--code-border);
             border-radius: 4px;
             padding: 2px 6px;
             font-family: 'Courier New', monospace;
             font-size: 0.9em;
-        }}
+        }
         
-        .markdown-content blockquote {{
+        .markdown-content blockquote {
             background-color: var(--blockquote-bg);
             border-left: 4px solid var(--blockquote-border);
             padding: 12px 15px;
             margin: 1em 0;
             font-style: italic;
-        }}
+        }
         
-        .markdown-content table {{
+        .markdown-content table {
             width: 100%;
             border-collapse: collapse;
             margin: 1em 0;
-        }}
+        }
         
         .markdown-content th,
-        .markdown-content td {{
+        .markdown-content td {
             border: 1px solid var(--message-border);
             padding: 8px 12px;
             text-align: left;
-        }}
+        }
         
-        .markdown-content th {{
+        .markdown-content th {
             background-color: var(--stats-bg);
             font-weight: bold;
-        }}
+        }"""
+
+# Drop comments, collapse runs of whitespace, and strip the spaces/semicolons
+# that only aid readability; one-time cost per process
+_CSS_MIN = re.sub(r'\s+', ' ', re.sub(r'/\*.*?\*/', '', _CSS_RAW, flags=re.S))
+_CSS_MIN = (_CSS_MIN.replace('{ ', '{').replace(' {', '{')
+            .replace('} ', '}').replace(' }', '}')
+            .replace('; ', ';').replace(': ', ':').replace(';}', '}')
+            .replace(', ', ',').strip())
+
+# Static document shell with light/dark mode toggle, split around the chat
+# body so the content fragments can be streamed straight to the output file.
+# Built once per process; braces in the prefix are doubled for str.format
+# (including the injected CSS), while the suffix is written verbatim.
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Conversation Chat Interface</title>
+"""
+
+# Name of the shared stylesheet written next to the output files when
+# --external-css is used; the default inline mode stays fully self-contained
+_CSS_FILENAME = 'chat_styles.css'
+
+_HTML_PREFIX = _HTML_HEAD + """    <style>
+""" + _CSS_MIN.replace('{', '{{').replace('}', '}}') + """
     </style>
 </head>
 <body>
@@ -600,9 +569,9 @@ def convert_conversation_to_html(input_file, output_file=None):
         <div class="header">
             <h1>Conversation Chat Interface</h1>
             <div class="conversation-info">
-                <span>Conversation: {data.get('name', 'Unknown Conversation')}</span>
-                <span>Created: {datetime.fromtimestamp(data['createdAt']/1000).strftime('%Y-%m-%d %H:%M:%S') if data.get('createdAt') else 'Unknown'}</span>
-                <span>Total Tokens: {data.get('tokenCount', 0)}</span>
+                <span>Conversation: {name}</span>
+                <span>Created: {created}</span>
+                <span>Total Tokens: {tokens}</span>
             </div>
             <button class="theme-toggle" id="themeToggle">
                 <span class="theme-toggle-icon" id="themeIcon">🌙</span>
@@ -611,7 +580,9 @@ def convert_conversation_to_html(input_file, output_file=None):
         </div>
         
         <div class="chat-container" id="chatContainer">
-            {content_html}
+            """
+
+_HTML_SUFFIX = """
         </div>
         
         <div class="footer">
@@ -621,105 +592,418 @@ def convert_conversation_to_html(input_file, output_file=None):
 
     <script>
         // Check for saved theme preference or respect system preference
-        function checkThemePreference() {{
+        function checkThemePreference() {
             const savedTheme = localStorage.getItem('theme');
             const prefersDarkScheme = window.matchMedia('(prefers-color-scheme: dark)');
             
-            if (savedTheme) {{
+            if (savedTheme) {
                 document.body.classList.toggle('dark-mode', savedTheme === 'dark');
                 updateThemeIcon(savedTheme === 'dark');
-            }} else if (prefersDarkScheme.matches) {{
+            } else if (prefersDarkScheme.matches) {
                 document.body.classList.add('dark-mode');
                 updateThemeIcon(true);
-            }}
-        }}
+            }
+        }
         
         // Update theme icon based on current mode
-        function updateThemeIcon(isDarkMode) {{
+        function updateThemeIcon(isDarkMode) {
             const icon = document.getElementById('themeIcon');
             icon.textContent = isDarkMode ? '☀️' : '🌙';
-        }}
+        }
         
         // Toggle theme
-        function toggleTheme() {{
+        function toggleTheme() {
             document.body.classList.toggle('dark-mode');
             const isDarkMode = document.body.classList.contains('dark-mode');
             localStorage.setItem('theme', isDarkMode ? 'dark' : 'light');
             updateThemeIcon(isDarkMode);
-        }}
+        }
         
         // Initialize theme on page load
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             checkThemePreference();
             document.getElementById('themeToggle').addEventListener('click', toggleTheme);
-        }});
+        });
     </script>
 </body>
 </html>"""
-    
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    print(f"HTML chat interface saved to {output_file}")
 
-def format_content(content):
-    """Format content with enhanced Markdown support."""
-    if not content:
-        return ""
-    
-    # Convert markdown-style elements
-    formatted = content
-    
-    # Handle code blocks (multi-line)
-    formatted = re.sub(r'```([\s\S]*?)```', r'<pre><code>\1</code></pre>', formatted)
-    
-    # Handle inline code 
-    formatted = re.sub(r'`([^`]+)`', r'<code>\1</code>', formatted)
-    
-    # Handle headers (# Header)
-    formatted = re.sub(r'^#{1,6}\s+(.*)$', r'<h3>\1</h3>', formatted, flags=re.MULTILINE)
+# The suffix never changes, so pay its UTF-8 encode once at import time
+_HTML_SUFFIX_BYTES = _HTML_SUFFIX.encode('utf-8')
+
+# Same prefix but referencing the shared stylesheet instead of embedding it
+_HTML_PREFIX_LINKED = _HTML_PREFIX.replace(
+    _HTML_PREFIX[_HTML_PREFIX.index('    <style>'):_HTML_PREFIX.index('</style>') + len('</style>\n')],
+    f'    <link rel="stylesheet" href="{_CSS_FILENAME}">\n')
+
+_MSG_CLOSE = "</div></div>"
+
+
+def _append_msg_open(version, role, add_part):
+    """Append the opening message bubble shared by every role."""
+    timestamp = ""
+    if 'preprocessed' in version and 'timestamp' in version['preprocessed']:
+        timestamp = _fmt_ts(version['preprocessed']['timestamp'])
+
+    # Get content: join every text part instead of scanning them all
+    # and keeping only the last one
+    content_parts = version.get('content') or _EMPTY_TUPLE
+    message_content = "\n".join(
+        part['text'] for part in content_parts if part.get('type') == 'text'
+    )
+
+    # Conditional sub-fragments are precomputed so the bubble template is a
+    # flat sequence of substitutions
+    role_cap = _ROLE_CAP.get(role)
+    if role_cap is None:
+        # Unexpected role straight from the JSON: escape it before it lands
+        # in the class attribute and the header
+        role_cap = escape(role.capitalize())
+        role = escape(role)
+    ts_span = _TS_SPAN_TMPL.format(ts=timestamp) if timestamp else ''
+    add_part(_MSG_OPEN_TMPL.format(
+        role=role,
+        role_cap=role_cap,
+        ts_span=ts_span,
+        body=format_content(message_content),
+    ))
+
+
+def _render_generic(version, role, parts):
+    """Render a message with no role-specific extras (user, system, tool)."""
+    _append_msg_open(version, role, parts.append)
+    parts.append(_MSG_CLOSE)
+
+
+def _render_assistant(version, role, parts):
+    """Render an assistant message: bubble plus steps, stats and tool calls."""
+    add_part = parts.append
+    _append_msg_open(version, role, add_part)
+
+    steps = version.get('steps')
+    if steps:
+        # Collect stats, thinking, duration and response fragments in a
+        # single pass over the steps; they are emitted afterwards in the
+        # usual order (thinking, duration, response, stats, tool calls)
+        stats_parts = []
+        tool_calls_parts = []
+        thinking_parts = []
+        duration_parts = []
+        response_parts = []
+        add_stat = stats_parts.append
+        add_tool_call = tool_calls_parts.append
+        add_thinking = thinking_parts.append
+        add_duration = duration_parts.append
+        add_response = response_parts.append
+        text_parts = []  # flattened (is_thinking, text) pairs
+
+        for step in steps:
+            # Pull the per-step fields into locals once; every branch
+            # below works off these instead of re-hashing the keys
+            step_type = step.get('type')
+            style = step.get('style') or _EMPTY_DICT
+            style_title = style.get('title', '') if isinstance(style, dict) else ''
+            gen_info = step.get('genInfo')
+            if gen_info:
+                stats = gen_info.get('stats') or _EMPTY_DICT
+
+                if stats:
+                    stat_items = []
+                    for key, label, suffix in _STAT_SPECS:
+                        value = stats.get(key)
+                        if value is not None:
+                            stat_items.append(f"{label}: {value}{suffix}")
+                    
+                    # Enhanced statistics - Add 1, 2, 3, 4, 6 and 7 metadata
+                    # 3. Model identifier and configuration details
+                    model_identifier = gen_info.get('indexedModelIdentifier', 'Unknown')
+                    if model_identifier != 'Unknown':
+                        # Extract just the model name for cleaner display
+                        model_name = model_identifier.split('/')[-1] if '/' in model_identifier else model_identifier
+                        stat_items.append(f"Model: {model_name}")
+                    
+                    # 2, 6, 7. Load-configuration details: index the fields
+                    # by key in one pass instead of walking the list per item
+                    load_model_config = gen_info.get('loadModelConfig')
+                    if load_model_config:
+                        cfg = {f.get('key'): f.get('value')
+                               for f in load_model_config.get('fields', _EMPTY_TUPLE)}
+                        if 'llm.load.contextLength' in cfg:
+                            stat_items.append(f"Context Length: {cfg['llm.load.contextLength']}")
+                        for cfg_key, label in _QUANT_SPECS:
+                            if cfg_key in cfg:
+                                value = cfg[cfg_key]
+                                quant = value.get('value', 'Unknown') if isinstance(value, dict) else 'Unknown'
+                                stat_items.append(f"{label}: {quant}")
+                        if 'llm.load.llama.cpuThreadPoolSize' in cfg:
+                            stat_items.append(f"CPU Threads: {cfg['llm.load.llama.cpuThreadPoolSize']}")
+                    
+                    # 4. Token efficiency metrics (calculate from tokens)
+                    prompt_tokens = stats.get('promptTokensCount', 0)
+                    predicted_tokens = stats.get('predictedTokensCount', 0)
+                    total_tokens = stats.get('totalTokensCount', 0)
+                    
+                    if predicted_tokens > 0 and prompt_tokens > 0:
+                        # Tokens per prompt token ratio
+                        tokens_per_prompt = round(predicted_tokens / prompt_tokens, 2)
+                        stat_items.append(f"Tokens/Prompt Token Ratio: {tokens_per_prompt}")
+                        
+                        # Efficiency (predicted vs total) 
+                        if total_tokens > 0:
+                            efficiency = round((predicted_tokens / total_tokens) * 100, 2)
+                            stat_items.append(f"Efficiency: {efficiency}%")
+                    
+                    # Only open the section once there is something to
+                    # show; sparse genInfo no longer emits an empty div
+                    if stat_items:
+                        add_stat(_STATS_OPEN)
+                        for item in stat_items:
+                            add_stat(_STAT_ITEM_TMPL.format(item=escape(item)))
+                        add_stat("</div>")
+        
+            # Flatten contentBlock text into (is_thinking, text) pairs;
+            # they are emitted in one flat loop after this pass
+            if step_type == 'contentBlock':
+                # Read the style type directly: O(1) and no false
+                # positives from 'thinking' elsewhere in the dict repr
+                is_thinking = isinstance(style, dict) and style.get('type') == 'thinking'
+                text_parts.extend(
+                    (is_thinking, part['text'])
+                    for part in (step.get('content') or _EMPTY_TUPLE)
+                    if part.get('type') == 'text'
+                )
+
+            # Capture thinking duration if available
+            if 'Thought for' in style_title and 'seconds' in style_title:
+                add_duration(_DURATION_OPEN)
+                add_duration(escape(style_title))
+                add_duration(_BLOCK_CLOSE)
+
+        # Classify the flattened text parts in a single flat loop
+        for is_thinking, text in text_parts:
+            if is_thinking:
+                add_thinking(_THINKING_OPEN)
+                add_thinking(format_content(text))
+                add_thinking(_BLOCK_CLOSE)
+            else:
+                add_response(_RESPONSE_OPEN)
+                add_response(format_content(text))
+                add_response(_BLOCK_CLOSE)
+
+        # Process tool calls
+        tool_calls = version.get('tool_calls')
+        if tool_calls:
+            add_tool_call(_TOOLS_OPEN)
+            for tool_call in tool_calls:
+                fn = tool_call.get('function') or _EMPTY_DICT
+                tool_name = escape(fn.get('name', 'Unknown'))
+                args = fn.get('arguments', _EMPTY_DICT)
+                # JSON instead of Python repr: valid for consumers and
+                # C-implemented, then escaped so it renders safely;
+                # exports that already carry a JSON string pass through
+                args_str = escape(args if isinstance(args, str) else _dumps(args))
+                add_tool_call(_TOOL_ITEM_TMPL.format(name=tool_name, args=args_str))
+            add_tool_call('</div>')
+
+        # Thinking first, then duration, then the model response
+        parts.extend(thinking_parts)
+        parts.extend(duration_parts)
+        parts.extend(response_parts)
+
+        # Add statistics and tool calls AFTER the response content
+        if stats_parts:
+            parts.extend(stats_parts)
+
+        if tool_calls_parts:
+            parts.extend(tool_calls_parts)
+
+    add_part(_MSG_CLOSE)
+
+
+# Per-role dispatch: each role's work lives in a tight function whose names
+# resolve via LOAD_FAST, and non-assistant messages never touch the
+# steps/stats machinery
+_RENDERERS = {'assistant': _render_assistant}
+
+
+def _ensure_css(out_dir):
+    """Write the shared stylesheet once; skip when an up-to-date copy exists."""
+    path = os.path.join(out_dir, _CSS_FILENAME)
+    data = _CSS_MIN.encode('utf-8')
+    try:
+        if os.path.getsize(path) == len(data):
+            return
+    except OSError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def convert_conversation_to_html(input_file, output_file=None, external_css=False):
+    """
+    Convert a conversation JSON file to an interactive HTML chat interface.
     
-    # Handle bold text (**bold** or __bold__)
-    formatted = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', formatted)
-    formatted = re.sub(r'__(.*?)__', r'<strong>\1</strong>', formatted)
+    Args:
+        input_file (str): Path to the input JSON file
+        output_file (str): Optional path to save the HTML output
+        external_css (bool): Link a shared chat_styles.css next to the output
+            instead of embedding the stylesheet in every file
+
+    Returns:
+        str: Path of the written HTML file
+    """
+    # Read as bytes: orjson wants bytes, and json.loads accepts them too,
+    # skipping the text-mode decode layer either way
+    with open(input_file, 'rb') as f:
+        data = _loads(f.read())
     
-    # Handle italic text (*italic* or _italic_)
-    formatted = re.sub(r'\*(.*?)\*', r'<em>\1</em>', formatted)
-    formatted = re.sub(r'_(.*?)_', r'<em>\1</em>', formatted)
+    # Prepare output filename if not provided
+    if not output_file:
+        base_name = os.path.splitext(input_file)[0]
+        output_file = f"{base_name}_chat.html"
+
+    # Degenerate exports (draft/unused entries in a batch directory) get a
+    # minimal document without running the full template path
+    msgs = data.get('messages') or ()
+    if not msgs and not data.get('systemPrompt'):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write('<!doctype html><meta charset="utf-8">'
+                    '<title>Empty Conversation</title><p>Empty conversation.</p>')
+        return output_file
+
+    # Build content as a list of fragments; joined once at the end so the
+    # accumulation stays linear instead of quadratic string concatenation
+    parts = []
+    add_part = parts.append  # pre-bound: skips the attribute lookup per call
+
+    # Add system prompt if exists
+    if data.get('systemPrompt'):
+        add_part(_SYSTEM_PROMPT_TMPL.format(text=_fmt(data['systemPrompt'])))
     
-    # Handle strikethrough
-    formatted = re.sub(r'~~(.*?)~~', r'<del>\1</del>', formatted)
+    # Process messages; the index was never used, so no enumerate
+    for message in msgs:
+        versions = message.get('versions')
+        if versions:
+            version = versions[0]
+            # Interning lets the renderer lookup and the CSS-class reuse
+            # hit identity fast paths instead of comparing characters
+            role = sys.intern(version.get('role', 'unknown'))
+            _RENDERERS.get(role, _render_generic)(version, role, parts)
+
+    # Stream the document: shell prefix, then each body fragment, then the
+    # suffix. Binary mode means only the dynamic content crosses the UTF-8
+    # encoder; the static suffix was encoded at import. The large buffer
+    # keeps write syscalls to a minimum.
+    if external_css:
+        _ensure_css(os.path.dirname(output_file) or '.')
+        prefix = _HTML_PREFIX_LINKED
+    else:
+        prefix = _HTML_PREFIX
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        f.write(prefix.format(
+            name=escape(data.get('name', 'Unknown Conversation')),
+            created=_fmt_ts(data.get('createdAt')),
+            tokens=data.get('tokenCount', 0),
+        ).encode('utf-8'))
+        for fragment in parts:
+            f.write(fragment.encode('utf-8'))
+        f.write(_HTML_SUFFIX_BYTES)
+
+    return output_file
+
+# All markdown constructs in one alternation so the text is scanned once;
+# code spans come first so their interior markers are consumed before the
+# emphasis groups can touch them, and emphasis handlers recurse for nesting
+_RE_MD = re.compile(
+    r'(?P<cb>```[\s\S]*?```)'
+    r'|(?P<ic>`[^`]+`)'
+    r'|(?P<h>^#{1,6}\s+.+$)'
+    r'|(?P<bq>^>\s+.+$)'
+    r'|(?P<b1>\*\*.+?\*\*)'
+    r'|(?P<b2>__.+?__)'
+    r'|(?P<st>~~.+?~~)'
+    r'|(?P<i1>\*.+?\*)'
+    r'|(?P<i2>_.+?_)',
+    re.MULTILINE,
+)
+
+# Quick membership probe for any markdown metacharacter; one C-level scan
+# that lets plain prose skip the tokenizer and list machine entirely
+_RE_MD_QUICK = re.compile(r'[`*_~#>]|- ')
+
+
+def _md_repl(m):
+    g = m.lastgroup
+    s = m.group()
+    if g == 'cb':
+        return f'<pre><code>{s[3:-3]}</code></pre>'
+    if g == 'ic':
+        return f'<code>{s[1:-1]}</code>'
+    if g == 'h':
+        return f'<h3>{_RE_MD.sub(_md_repl, s.lstrip("#").lstrip())}</h3>'
+    if g == 'bq':
+        return f'<blockquote>{_RE_MD.sub(_md_repl, s[1:].lstrip())}</blockquote>'
+    if g == 'b1' or g == 'b2':
+        return f'<strong>{_RE_MD.sub(_md_repl, s[2:-2])}</strong>'
+    if g == 'st':
+        return f'<del>{_RE_MD.sub(_md_repl, s[2:-2])}</del>'
+    return f'<em>{_RE_MD.sub(_md_repl, s[1:-1])}</em>'
+
+
+_FORMAT_CACHE_MAX = 8192
+
+
+@lru_cache(maxsize=4096)
+def _format_content_cached(content):
+    # Fast path: no markdown metacharacters anywhere, so only the paragraph
+    # and line-break conversion applies
+    if _RE_MD_QUICK.search(content) is None:
+        formatted = content.replace('\n\n', '</p><p>').replace('\n', '<br>')
+        if not formatted.startswith('<'):
+            formatted = f'<p>{formatted}</p>'
+        return formatted
+
+    # Convert every markdown construct in one linear pass; _md_repl
+    # dispatches on the matched group and recurses for nested emphasis
+    formatted = _RE_MD.sub(_md_repl, content)
     
-    # Handle bullet lists (starting with - or *)
-    lines = formatted.split('\n')
+    # Handle bullet lists (starting with - or *): one forward scan with an
+    # in-list flag, emitting each line once and closing the <ul> explicitly
+    # on every transition (the old in-place patching duplicated the line that
+    # ended a list and left a list unclosed at end of text). The substring
+    # probe keeps list-free text out of the split/rejoin entirely.
+    if '- ' not in formatted and '* ' not in formatted:
+        formatted = formatted.replace('\n\n', '</p><p>').replace('\n', '<br>')
+        if not formatted.startswith('<'):
+            formatted = f'<p>{formatted}</p>'
+        return formatted
+
+    out_lines = []
+    emit = out_lines.append
     in_list = False
-    for i, line in enumerate(lines):
-        if line.strip().startswith(('- ', '* ')):
+    for line in formatted.split('\n'):
+        stripped = line.strip()
+        if stripped[:2] in ('- ', '* '):
             if not in_list:
-                lines[i] = '<ul><li>' + line[2:].strip() + '</li>'
+                emit('<ul><li>' + line[2:].strip() + '</li>')
                 in_list = True
             else:
-                lines[i] = '<li>' + line[2:].strip() + '</li>'
-        elif in_list and line.strip():
-            # Check if this is a new list item or continuation of previous 
-            if not line.startswith('- ') and not line.startswith('* '):
-                lines[i-1] += '</ul><p>' + line
-                in_list = False
-            else:
-                lines[i] = '<li>' + line[2:].strip() + '</li>'
+                emit('<li>' + line[2:].strip() + '</li>')
+        elif in_list and stripped:
+            out_lines[-1] += '</ul><p>' + line
+            in_list = False
         elif in_list:
-            # End of list if we encounter a blank line or non-list item
-            if not line.strip():
-                lines[i-1] += '</ul>'
-                in_list = False
-    
-    formatted = '\n'.join(lines)
+            out_lines[-1] += '</ul>'
+            emit(line)
+            in_list = False
+        else:
+            emit(line)
+    if in_list:
+        out_lines[-1] += '</ul>'
     
-    # Handle blockquotes (lines starting with >)
-    formatted = re.sub(r'^>\s+(.*)$', r'<blockquote>\1</blockquote>', formatted, flags=re.MULTILINE)
+    formatted = '\n'.join(out_lines)
     
-    # Convert new lines to <br> tags
+# Convert new lines to <br> tags
     formatted = formatted.replace('\n\n', '</p><p>').replace('\n', '<br>')
     
     # Add paragraph tags around content
@@ -728,14 +1012,74 @@ def format_content(content):
     
     return formatted
 
+
+def format_content(content):
+    """Format content with enhanced Markdown support.
+
+    Pure and deterministic, so short messages (stock replies, repeated tool
+    output) are memoized; transcript-sized blobs bypass the cache to avoid
+    pinning them in memory.
+    """
+    if not content:
+        return ""
+    if len(content) < _FORMAT_CACHE_MAX:
+        return _format_content_cached(content)
+    return _format_content_cached.__wrapped__(content)
+
 # Usage
+def _expand_inputs(pattern):
+    """Resolve a file path, directory, or glob pattern into JSON files."""
+    if os.path.isdir(pattern):
+        return sorted(glob.glob(os.path.join(pattern, '*.json')))
+    if any(ch in pattern for ch in '*?['):
+        return sorted(glob.glob(pattern))
+    return [pattern]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Convert LM Studio conversation JSON files into HTML chat pages.')
+    parser.add_argument('input', help='input JSON file, directory, or glob pattern')
+    parser.add_argument('output', nargs='?', default=None,
+                        help='output HTML file (single input only)')
+    parser.add_argument('--out-dir', default=None,
+                        help='directory to write the generated HTML files to')
+    parser.add_argument('--external-css', action='store_true',
+                        help='share one chat_styles.css next to the outputs '
+                             'instead of embedding the stylesheet in each file')
+    args = parser.parse_args(argv)
+
+    inputs = _expand_inputs(args.input)
+    if not inputs:
+        parser.error(f'no input files match {args.input!r}')
+    if args.output and len(inputs) > 1:
+        parser.error('an explicit output file only works with a single input')
+
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+
+    def out_path(path):
+        if args.output:
+            return args.output
+        if args.out_dir:
+            base = os.path.splitext(os.path.basename(path))[0]
+            return os.path.join(args.out_dir, f'{base}_chat.html')
+        return None
+
+    if len(inputs) == 1:
+        print(f"HTML chat interface saved to "
+              f"{convert_conversation_to_html(inputs[0], out_path(inputs[0]), args.external_css)}")
+        return
+
+    # Conversions are independent and CPU-bound in parsing/templating, so a
+    # batch fans out one process per core instead of paying startup N times
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(convert_conversation_to_html, path, out_path(path),
+                                   args.external_css)
+                   for path in inputs]
+        for future in futures:
+            print(f"HTML chat interface saved to {future.result()}")
+
+
 if __name__ == "__main__":
-    import sys
-    if len(sys.argv) < 2:
-        print("Usage: python3 convert_chat_html.py <input_file.json> [output_file.html]")
-        sys.exit(1)
-    
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
-    
-    convert_conversation_to_html(input_file, output_file)
+    main()